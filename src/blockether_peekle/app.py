@@ -0,0 +1,152 @@
+"""
+The Peekle Textual application: pickle loading wired to the REPL and the data tree.
+
+Kept separate from the CLI entry point so that `--help` and argument errors
+never pay for importing Textual, Rich and Jedi.
+"""
+
+import logging
+import pickle
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from textual import on, work
+from textual.app import App, ComposeResult
+from textual.binding import Binding
+from textual.reactive import reactive
+from textual.widgets import Footer
+from textual.worker import get_current_worker
+
+from blockether_peekle.utils import load_pickle
+from blockether_peekle.widgets import PeekleRepl, PeekleReplTextAreaAutocomplete, PeekleTree
+
+if TYPE_CHECKING:
+    from blockether_peekle.screens import LoadFileScreenState
+
+# Bound on how many objects are visited when looking for modules to warm Jedi's cache with
+_PRELOAD_SCAN_LIMIT = 100
+_PRELOAD_SKIPPED_MODULES = frozenset({"builtins", "__main__"})
+# How unpickling a user's file fails: unreadable or corrupt data (gzip.BadGzipFile is an OSError), or classes
+# whose module or attribute is missing from this environment
+_LOAD_ERRORS = (OSError, EOFError, pickle.UnpicklingError, ImportError, AttributeError)
+
+_logger = logging.getLogger(__name__)
+
+
+def _data_modules(data: Any) -> set[str]:
+    """Top-level modules defining the types near the root of loaded data (bounded breadth-first walk)."""
+    modules: set[str] = set()
+    queue = [data]
+    for obj in queue:
+        module = type(obj).__module__.partition(".")[0]
+        if module not in _PRELOAD_SKIPPED_MODULES:
+            modules.add(module)
+        if len(queue) < _PRELOAD_SCAN_LIMIT:
+            if isinstance(obj, dict):
+                queue.extend(islice(obj.values(), _PRELOAD_SCAN_LIMIT - len(queue)))
+            elif isinstance(obj, (list, tuple, set)):
+                queue.extend(islice(obj, _PRELOAD_SCAN_LIMIT - len(queue)))
+    return modules
+
+
+class PeekleApp(App):
+    ENABLE_COMMAND_PALETTE = False
+
+    BINDINGS = [
+        Binding(
+            key="ctrl+o",
+            action="trigger_load_file_menu",
+            description="Open pickle file",
+        ),
+    ]
+
+    _filepath: reactive[Optional[Path]] = reactive(None)
+    _data: reactive[Any] = reactive(None)
+    _variable_name: reactive[str] = reactive("x")
+
+    def __init__(self, filepath: Optional[Path] = None) -> None:
+        self._text_area_widget: Optional[PeekleReplTextAreaAutocomplete] = None
+        self._repl = PeekleRepl()
+        self._tree = PeekleTree()
+        super().__init__()
+        self._filepath = filepath
+
+    def on_mount(self) -> None:
+        self.title = "Peekle"
+
+        if self._filepath:
+            self._load_file(self._filepath)
+
+    def action_trigger_load_file_menu(self) -> None:
+        # The dialog is only needed once the user asks for it, so it stays off the start-up path
+        from blockether_peekle.screens import LoadFileScreen
+
+        def on_load_file(data: Optional["LoadFileScreenState"]) -> None:
+            if data is None:
+                return
+
+            self._load_file(data.path, data.variable_name)
+
+        self.push_screen(LoadFileScreen(), on_load_file)
+
+    def _load_file(self, filepath: Path, variable_name: str = "x") -> None:
+        """Show the tree as loading and unpickle the file in the background."""
+        self._tree.loading = True
+        self._load_file_worker(filepath, variable_name)
+
+    @work(thread=True, exclusive=True, group="load")
+    def _load_file_worker(self, filepath: Path, variable_name: str) -> None:
+        """Load a pickle file off the event loop so large files don't freeze the UI."""
+        worker = get_current_worker()
+        try:
+            data = load_pickle(filepath)
+        except _LOAD_ERRORS as e:
+            # A superseded load must not report over the newer one, nor clear what it loaded
+            if not worker.is_cancelled:
+                self.call_from_thread(self._handle_load_failed, filepath, e)
+            return
+        except Exception:
+            # Anything else is a bug rather than a bad file: keep the traceback and let the worker fail
+            _logger.exception("Unexpected error loading %s", filepath)
+            raise
+
+        # A newer load superseded this one while it was unpickling
+        if worker.is_cancelled:
+            return
+        self.call_from_thread(self._apply_loaded_data, filepath, variable_name, data)
+
+        # Warm Jedi for the data's libraries so the first `x.` completion doesn't pay the cold parse
+        for module in _data_modules(data):
+            if worker.is_cancelled:
+                return
+            self._repl.preload_completion_module(module)
+
+    def _apply_loaded_data(self, filepath: Path, variable_name: str, data: Any) -> None:
+        """Publish freshly loaded data to the REPL and the tree."""
+        self._tree.loading = False
+        self._filepath = filepath
+        self._variable_name = variable_name
+        self._data = data
+
+        self.notify(f"[green]✓[/green] Loaded: {filepath} [dim]Type: {type(self._data).__name__}[/dim]")
+
+        self._repl.update_locals_data(self._variable_name, self._data)
+        self._tree.update_tree_data(self._variable_name, self._data)
+
+    def _handle_load_failed(self, filepath: Path, error: Exception) -> None:
+        """Report a failed load and forget the previous file."""
+        self._tree.loading = False
+        self.notify(f"[red]✗[/red] Error loading {filepath} file: {error}")
+        self._data = None
+        self._filepath = None
+
+    @on(PeekleRepl.QueryExecuted)
+    def handle_query_executed(self, message: PeekleRepl.QueryExecuted) -> None:
+        """Handle query executed message to update tree."""
+        self._tree.update_tree_data(message.query, message.result)
+
+    def compose(self) -> ComposeResult:
+        yield self._repl
+        yield self._tree
+        yield Footer(show_command_palette=False)
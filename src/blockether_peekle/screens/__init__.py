@@ -0,0 +1,5 @@
+"""Screens package for Blockether Peekle."""
+
+from .load_file_screen import LoadFilePathInput, LoadFileScreen, LoadFileScreenState
+
+__all__ = ["LoadFilePathInput", "LoadFileScreen", "LoadFileScreenState"]
@@ -0,0 +1,108 @@
+"""Modal screen for picking a pickle file and the variable name to load it into."""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import ClassVar
+
+from textual import on
+from textual.app import ComposeResult
+from textual.containers import Container
+from textual.screen import ModalScreen
+from textual.widget import Widget
+from textual.widgets import Input
+
+from blockether_peekle.widgets.autocomplete import PathAutocomplete, PathOption, TargetState
+
+
+@dataclass
+class LoadFileScreenState:
+    path: Path
+    variable_name: str
+
+
+class LoadFilePathInput(PathAutocomplete):
+    _extensions: ClassVar[tuple[str, ...]] = (".pkl", ".pickle", ".p", ".pkl.gz", ".pickle.gz")
+    # Directory options already end with "/", so they match without a stat() per entry
+    _candidate_suffixes: ClassVar[tuple[str, ...]] = ("/", *_extensions)
+
+    def get_candidates(self, target_state: TargetState) -> list[PathOption]:
+        candidates = super().get_candidates(target_state)
+
+        return [item for item in candidates if item.value.endswith(self._candidate_suffixes)]
+
+    def post_completion(self) -> None:
+        if not self.target.value.endswith(self._extensions) or not os.path.isfile(self.target.value):
+            return super().post_completion()
+
+        self.post_message(self.Submitted(self.target.value))
+
+
+class LoadFileScreen(ModalScreen[LoadFileScreenState]):
+    DEFAULT_CSS = """
+    LoadFileScreen {
+        align: center middle;
+    }
+
+    #dialog {
+        padding: 1 1 0 1;
+        width: 90%;
+        height: auto;
+        border: thick $background 60%;
+        border-title-color: $foreground;
+        border-title-style: bold;
+        background: $surface;
+    }
+
+    Input {
+        border: solid $foreground !important;
+        border-title-color: $foreground !important;
+    }
+
+    Container {
+        height: auto;
+    }
+
+    #dialog-path {
+        margin-bottom: 1;
+    }
+    """
+
+    def on_mount(self) -> None:
+        self.query_one("#dialog").border_title = "Open Pickle File"
+
+    @on(LoadFilePathInput.Submitted)
+    def handle_load_file_path_input_submitted(self, message: LoadFilePathInput.Submitted) -> None:
+        """Handle submitted code from the input."""
+        self.query("#varname").focus()
+
+    @on(Input.Submitted)
+    def handle_input_submitted(self, message: Input.Submitted) -> None:
+        """Handle submitted code from the input."""
+        if message.input.id == "varname":
+            self.dismiss(
+                LoadFileScreenState(
+                    path=Path(self.query_one(LoadFilePathInput).target.value),
+                    variable_name=message.input.value.strip(),
+                )
+            )
+
+    def compose(self) -> ComposeResult:
+        path_input_widget = Input(placeholder="~/")
+        path_input_widget.border_title = "File path"
+
+        variable_name_input_widget = Input(placeholder="Variable name", id="varname", value="x")
+        variable_name_input_widget.border_title = "Variable name"
+
+        yield Widget(
+            Container(
+                path_input_widget,
+                LoadFilePathInput(target=path_input_widget),
+                id="dialog-path",
+            ),
+            variable_name_input_widget,
+            id="dialog",
+        )
+
+    def key_escape(self) -> None:
+        self.app.pop_screen()
@@ -1,5 +1,6 @@
 """Utils package for Blockether Peekle."""
 
 from .format_value import format_value
+from .load_pickle import load_pickle
 
-__all__ = ["format_value"]
+__all__ = ["format_value", "load_pickle"]
@@ -1,28 +1,92 @@
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
 
 
-def format_value(value: Any, max_length: int = 80) -> str:
-    """Format a value for display with colors visible in both dark and light themes."""
-    if value is None:
-        return "[bold magenta]None[/bold magenta]"
-    elif isinstance(value, bool):
-        return f"[bold cyan]{value}[/bold cyan]"
+@lru_cache(maxsize=1024)
+def _quote_str(value: str) -> str:
+    """Quote an already truncated string; the same keys and labels recur across a data walk."""
+    return f"[bold green]{repr(value)}[/bold green]"
+
+
+def _format_none(value: None, max_length: int) -> str:
+    return "[bold magenta]None[/bold magenta]"
+
+
+def _format_bool(value: bool, max_length: int) -> str:
+    return f"[bold cyan]{value}[/bold cyan]"
+
+
+def _format_number(value: Any, max_length: int) -> str:
+    return f"[bold blue]{value}[/bold blue]"
+
+
+def _format_str(value: str, max_length: int) -> str:
+    if len(value) > max_length:
+        value = value[:max_length] + "..."
+    # Subclasses can repr differently from an equal plain str, so they bypass the cache
+    return _quote_str(value) if type(value) is str else f"[bold green]{repr(value)}[/bold green]"
+
+
+def _format_bytes(value: bytes, max_length: int) -> str:
+    return f"[bold red]<bytes: {len(value)} bytes>[/bold red]"
+
+
+def _format_dict(value: dict, max_length: int) -> str:
+    items = list(value.items())[:4]
+    formatted_items = [f"{k}: {type(v).__name__}" for k, v in items]
+    if len(value) > 4:
+        formatted_items.append("...")
+    return f"[bold yellow]{{{', '.join(formatted_items)}}}[/bold yellow]"
+
+
+# Exact-type dispatch for the common cases; subclasses fall through to the isinstance chain (bool can't be subclassed)
+_FORMATTERS: Dict[type, Callable[[Any, int], str]] = {
+    type(None): _format_none,
+    bool: _format_bool,
+    int: _format_number,
+    float: _format_number,
+    str: _format_str,
+    bytes: _format_bytes,
+    dict: _format_dict,
+}
+
+
+def _format_array_summary(value: Any) -> Optional[str]:
+    """Shape/dtype summary of an n-dimensional array-like, or None when the value isn't one."""
+    try:
+        shape, dtype = value.shape, value.dtype
+    except Exception:
+        # Arbitrary objects may raise anything from a property; such values fall back to str()
+        return None
+    # 0-d values (NumPy scalars) and duck-typed look-alikes are shown by value instead
+    if not isinstance(shape, tuple) or not shape:
+        return None
+    return f"[bold yellow]<{type(value).__name__} shape={tuple(shape)} dtype={dtype}>[/bold yellow]"
+
+
+def format_value(value: Any, max_length: int = 80, summarize_arrays: bool = False) -> str:
+    """Format a value for display with colors visible in both dark and light themes.
+
+    With `summarize_arrays`, n-dimensional array-likes (NumPy, PyTorch, ...) are described by shape and dtype
+    instead of being converted to a string, which walks their whole buffer.
+    """
+    formatter = _FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value, max_length)
     elif isinstance(value, (int, float)):
-        return f"[bold blue]{value}[/bold blue]"
+        return _format_number(value, max_length)
     elif isinstance(value, str):
-        if len(value) > max_length:
-            value = value[:max_length] + "..."
-        return f"[bold green]{repr(value)}[/bold green]"
+        return _format_str(value, max_length)
     elif isinstance(value, bytes):
-        return f"[bold red]<bytes: {len(value)} bytes>[/bold red]"
+        return _format_bytes(value, max_length)
     elif isinstance(value, dict):
-        items = list(value.items())[:4]
-        formatted_items = [f"{k}: {type(v).__name__}" for k, v in items]
-        if len(value) > 4:
-            formatted_items.append("...")
-        return f"[bold yellow]{{{', '.join(formatted_items)}}}[/bold yellow]"
-    else:
-        str_repr = str(value)
-        if len(str_repr) > max_length:
-            str_repr = str_repr[:max_length] + "..."
-        return f"[bold yellow]{str_repr}[/bold yellow]"
+        return _format_dict(value, max_length)
+
+    summary = _format_array_summary(value) if summarize_arrays else None
+    if summary is not None:
+        return summary
+
+    str_repr = str(value)
+    if len(str_repr) > max_length:
+        str_repr = str_repr[:max_length] + "..."
+    return f"[bold yellow]{str_repr}[/bold yellow]"
@@ -0,0 +1,44 @@
+import gzip
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+
+_MIN_READ_BUFFER_SIZE = 1024 * 1024
+_MAX_READ_BUFFER_SIZE = 16 * 1024 * 1024
+_READ_BUFFER_FILE_FRACTION = 64
+_GZIP_SUFFIX = ".gz"
+
+
+def _read_buffer_size(filepath: Path) -> int:
+    """Read buffer scaled to the file size, so multi-GB pickles need far fewer read calls."""
+    size = filepath.stat().st_size // _READ_BUFFER_FILE_FRACTION
+    return max(_MIN_READ_BUFFER_SIZE, min(_MAX_READ_BUFFER_SIZE, size))
+
+
+# posix_fadvise and its advice constants only exist on some platforms (not macOS or Windows)
+try:
+    _READ_AHEAD_ADVICE: tuple[int, ...] = (os.POSIX_FADV_SEQUENTIAL, os.POSIX_FADV_WILLNEED)
+except AttributeError:
+    _READ_AHEAD_ADVICE = ()
+
+
+def _advise_sequential(fd: int) -> None:
+    """Hint the kernel to read ahead aggressively; a no-op where posix_fadvise is unavailable."""
+    for advice in _READ_AHEAD_ADVICE:
+        try:
+            os.posix_fadvise(fd, 0, 0, advice)
+        except OSError:
+            # Some filesystems (pipes, FUSE mounts) reject the hint; reading works regardless
+            return
+
+
+def load_pickle(filepath: Path) -> Any:
+    """Unpickle a file through a large read buffer, transparently decompressing `.gz` files."""
+    if filepath.suffix == _GZIP_SUFFIX:
+        with gzip.open(filepath, "rb") as compressed:
+            return pickle.Unpickler(compressed).load()
+
+    with open(filepath, "rb", buffering=_read_buffer_size(filepath)) as f:
+        _advise_sequential(f.fileno())
+        return pickle.Unpickler(f).load()
@@ -1,5 +1,13 @@
 """Widgets package for Blockether Peekle."""
 
 from .autocomplete import TextAreaAutocomplete
+from .peekle_repl import PeekleRepl, PeekleReplTextArea, PeekleReplTextAreaAutocomplete
+from .peekle_tree import PeekleTree
 
-__all__ = ["TextAreaAutocomplete"]
+__all__ = [
+    "PeekleRepl",
+    "PeekleReplTextArea",
+    "PeekleReplTextAreaAutocomplete",
+    "PeekleTree",
+    "TextAreaAutocomplete",
+]
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from functools import cached_property
 from typing import (
     Any,
     Callable,
     ClassVar,
     Generic,
+    NamedTuple,
     Sequence,
     TypeVar,
     cast,
@@ -21,6 +22,8 @@ from textual.content import Content
 from textual.css.query import NoMatches
 from textual.geometry import Offset, Region, Spacing
 from textual.message import Message
+from textual.timer import Timer
+from textual.visual import VisualType
 from textual.widget import Widget
 from textual.widgets import Input, OptionList, TextArea
 from textual.widgets.option_list import Option
@@ -32,8 +35,7 @@ TargetWidget = TypeVar("TargetWidget", TextArea, Input)
 AutocompleteOptionType = TypeVar("AutocompleteOptionType", bound="AutocompleteOption")
 
 
-@dataclass
-class TargetState:
+class TargetState(NamedTuple):
     text: str
     """The content in the target widget."""
 
@@ -50,6 +52,17 @@ class AutocompleteOption(Option):
     ) -> None:
         super().__init__(prompt, id, disabled)
 
+    @cached_property
+    def prompt_text(self) -> object:
+        """The prompt as compared against the search string: plain text for styled prompts, extracted once."""
+        prompt = self.prompt
+        return prompt.plain if isinstance(prompt, (Text, Content)) else prompt
+
+    def _set_prompt(self, prompt: VisualType) -> None:
+        """Replace the prompt, dropping the plain text extracted from the old one."""
+        self.__dict__.pop("prompt_text", None)
+        super()._set_prompt(prompt)
+
 
 class AutocompleteOptionHit(AutocompleteOption):
     """A dropdown item which matches the current search string - in other words
@@ -98,6 +111,12 @@ class Autocomplete(Widget, Generic[TargetWidget]):
         "autocomplete--highlight-match",
     }
 
+    TARGET_UPDATE_DELAY: ClassVar[float] = 0.04
+    """Seconds of typing quiet before the dropdown is rebuilt, so a burst of keystrokes costs one rebuild."""
+
+    _FLUSH_KEYS: ClassVar[frozenset[str]] = frozenset({"down", "up", "enter", "tab", "escape"})
+    """Keys that act on the dropdown, and so must see it up to date."""
+
     class Submitted(Message):
         """Target widget submitted message."""
 
@@ -108,7 +127,9 @@ class Autocomplete(Widget, Generic[TargetWidget]):
     def __init__(
         self,
         target: TargetWidget,
-        candidates: Callable[[TargetState], Sequence[AutocompleteOptionType]] | None = None,
+        candidates: (
+            Sequence[AutocompleteOptionType] | Callable[[TargetState], Sequence[AutocompleteOptionType]] | None
+        ) = None,
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
@@ -128,15 +149,24 @@ class Autocomplete(Widget, Generic[TargetWidget]):
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
         self._target: TargetWidget = target
 
-        # Users can supply strings as a convenience for the simplest cases,
-        # so let's convert them to AutocompleteOptions.
-        self.candidates: Sequence[AutocompleteOption] | Callable[[TargetState], Sequence[AutocompleteOptionType]] | None
-        """The candidates to match on, or a function which returns the candidates to match on."""
+        self._candidates: tuple[AutocompleteOption, ...] | Callable[[TargetState], Sequence[Any]] | None = None
         self.candidates = candidates
 
         self._target_state = TargetState("", (0, 0))
         """Cached state of the target TargetWidget."""
 
+        self._shown_candidates: Sequence[AutocompleteOption] | None = None
+        """The candidate sequence currently loaded into the dropdown."""
+
+        self._target_update_timer: Timer | None = None
+        """Pending debounced dropdown update, if any."""
+
+        self._target_update_visibility = False
+        """Whether the pending update follows a text change, and so should re-evaluate visibility."""
+
+        self._candidates_deferred = False
+        """Whether the dropdown was emptied for an empty target without fetching its candidates."""
+
     def compose(self) -> ComposeResult:
         option_list = AutoCompleteList()
         option_list.can_focus = False
@@ -146,8 +176,8 @@ class Autocomplete(Widget, Generic[TargetWidget]):
         # Subscribe to the target widget's reactive attributes.
         self.target.message_signal.subscribe(self, self._listen_to_messages)  # type: ignore
         self._subscribe_to_target()
-        self._handle_target_update()
-        self.set_interval(0.2, lambda: self.call_after_refresh(self._align_to_target))
+        self._target_update_visibility = True
+        self._flush_target_update()
 
     def _submit(self) -> None:
         """Submit the current widget content."""
@@ -173,16 +203,28 @@ class Autocomplete(Widget, Generic[TargetWidget]):
             # during application shutdown.
             return
 
+        if isinstance(event, events.Resize):
+            # The target moved or resized with the layout (e.g. the terminal was resized)
+            self._align_to_target()
+            return
+
+        if isinstance(event, events.Key) and event.key in self._FLUSH_KEYS and self._target_update_timer is not None:
+            # Navigating or completing must act on the options for the text as it is now
+            self._flush_target_update()
+
+        if isinstance(event, events.Key) and event.key == "down" and self._candidates_deferred:
+            self._rebuild_options(self._target_state, force=True)
+
         if isinstance(event, events.Key) and option_list.option_count:
             displayed = self.display
             highlighted = option_list.highlighted or 0
             if event.key == "down":
                 # Check if there's only one item and it matches the search string
                 if option_list.option_count == 1:
-                    search_string = self.get_search_string(self._get_target_state())
-                    first_option = option_list.get_option_at_index(0).prompt
-                    text_from_option = first_option.plain if isinstance(first_option, Text) else first_option
-                    if text_from_option == search_string:
+                    # The target state is current: any pending update was flushed above
+                    search_string = self.get_search_string(self._target_state)
+                    first_option = cast(AutocompleteOption, option_list.get_option_at_index(0))
+                    if first_option.prompt_text == search_string:
                         # Don't prevent default behavior in this case
                         return
 
@@ -191,27 +233,21 @@ class Autocomplete(Widget, Generic[TargetWidget]):
                 event.prevent_default()
                 event.stop()
                 if displayed:
-                    highlighted = (highlighted + 1) % option_list.option_count
+                    # OptionList's own navigation wraps around and scrolls the highlight into view
+                    option_list.action_cursor_down()
                 else:
                     self.display = True
-                    highlighted = 0
-
-                option_list.highlighted = highlighted
+                    option_list.highlighted = 0
 
             elif event.key == "up":
                 if displayed:
                     event.prevent_default()
                     event.stop()
-                    highlighted = (highlighted - 1) % option_list.option_count
-                    option_list.highlighted = highlighted
-            elif event.key == "enter":
-                event.prevent_default()
-                event.stop()
-                self._complete(option_index=highlighted)
-            elif event.key == "tab" and self.display and option_list.option_count > 0:
+                    option_list.action_cursor_up()
+            elif event.key in ("tab", "enter") and displayed:
                 event.prevent_default()
                 event.stop()
-                self._complete(option_index=highlighted)
+                self._complete(cast(AutocompleteOption, option_list.get_option_at_index(highlighted)))
             elif event.key == "escape":
                 if displayed:
                     event.prevent_default()
@@ -229,14 +265,11 @@ class Autocomplete(Widget, Generic[TargetWidget]):
     def action_show(self) -> None:
         self.styles.display = "block"
 
-    def _complete(self, option_index: int) -> None:
+    def _complete(self, option: AutocompleteOption) -> None:
         """Do the completion (i.e. insert the selected item into the target Widget).
 
         This is when the user highlights an option in the dropdown and presses tab or enter.
         """
-        option_list = self.option_list
-        highlighted = option_index
-        option = cast(AutocompleteOption, option_list.get_option_at_index(highlighted))
         with self.prevent(Input.Changed, TextArea.Changed):
             self.apply_completion(option, self._get_target_state())
         self.post_completion()
@@ -263,11 +296,13 @@ class Autocomplete(Widget, Generic[TargetWidget]):
         target = self.target
         self.watch(target, "has_focus", self._handle_focus_change)
         self.watch(target, "selection", self._align_and_rebuild)
+        # Scrolling moves the cursor on screen without moving it in the text
+        self.watch(target, "scroll_x", self._align_to_target, init=False)
+        self.watch(target, "scroll_y", self._align_to_target, init=False)
 
     def _align_and_rebuild(self) -> None:
-        self._align_to_target()
-        self._target_state = self._get_target_state()
-        self._rebuild_options(self._target_state)
+        # Typing moves the cursor too, so this is coalesced with the text change into one update
+        self._schedule_target_update()
 
     def _align_to_target(self) -> None:
         """Align the dropdown to the position of the cursor within
@@ -284,7 +319,11 @@ class Autocomplete(Widget, Generic[TargetWidget]):
                 Spacing.all(0),
                 self.screen.scrollable_content_region,
             )
-            self.absolute_offset = Offset(x, y)
+            offset = Offset(x, y)
+            # Most alignments (repeated updates, scrolls that keep the cursor in place) land on the same spot
+            if offset == self.absolute_offset:
+                return
+            self.absolute_offset = offset
             self.refresh(layout=True)
         except NoMatches:
             return
@@ -305,27 +344,44 @@ class Autocomplete(Widget, Generic[TargetWidget]):
         if not has_focus:
             self.action_hide()
         else:
-            target_state = self._get_target_state()
-            self._rebuild_options(target_state)
+            self._target_state = self._get_target_state()
+            self._rebuild_options(self._target_state)
 
     def _handle_target_update(self) -> None:
-        """Called when the state (text or cursor position) of the target is updated.
+        """Called when the text of the target is updated.
 
-        Here we align the dropdown to the target, determine if it should be visible,
-        and rebuild the options in it.
+        Here we schedule aligning the dropdown to the target, determining if it should be visible,
+        and rebuilding the options in it.
         """
-        self._target_state = self._get_target_state()
-        search_string = self.get_search_string(self._target_state)
-
-        # Determine visibility after the user makes a change in the
+        # Visibility is only re-evaluated after the user makes a change in the
         # target widget (e.g. typing in a character in the Widget).
+        self._target_update_visibility = True
+        self._schedule_target_update()
+
+    def _schedule_target_update(self) -> None:
+        """(Re)start the debounce timer, so a burst of changes is handled once it goes quiet."""
+        if self._target_update_timer is not None:
+            self._target_update_timer.stop()
+        self._target_update_timer = self.set_timer(self.TARGET_UPDATE_DELAY, self._flush_target_update)
+
+    def _flush_target_update(self) -> None:
+        """Run the pending target update now."""
+        if self._target_update_timer is not None:
+            self._target_update_timer.stop()
+            self._target_update_timer = None
+
+        self._target_state = self._get_target_state()
         self._rebuild_options(self._target_state)
         self._align_to_target()
-
-        if self.should_show_dropdown(search_string):
-            self.action_show()
-        else:
-            self.action_hide()
+        # The dropdown's new size is only known once it has been laid out with the new options
+        self.call_after_refresh(self._align_to_target)
+
+        if self._target_update_visibility:
+            self._target_update_visibility = False
+            if self.should_show_dropdown(self.get_search_string(self._target_state)):
+                self.action_show()
+            else:
+                self.action_hide()
 
     def should_show_dropdown(self, search_string: str) -> bool:
         """
@@ -345,24 +401,36 @@ class Autocomplete(Widget, Generic[TargetWidget]):
         if len(search_string) == 0 or option_count == 0:
             return False
         elif option_count == 1:
-            first_option = option_list.get_option_at_index(0).prompt
-            text_from_option = first_option.plain if isinstance(first_option, Text) else first_option
-            return text_from_option != search_string
+            first_option = cast(AutocompleteOption, option_list.get_option_at_index(0))
+            return first_option.prompt_text != search_string
         else:
             return True
 
-    def _rebuild_options(self, target_state: TargetState) -> None:
+    def _rebuild_options(self, target_state: TargetState, force: bool = False) -> None:
         """Rebuild the options in the dropdown.
 
         Args:
             target_state: The state of the target widget.
+            force: Fetch candidates even when the target is empty.
         """
         option_list = self.option_list
-        option_list.clear_options()
-
-        if self.target.has_focus:
+        # An empty target (e.g. right after a submit cleared it) never shows the dropdown by itself, so its
+        # candidates are only fetched once the user explicitly asks for them with `down`
+        self._candidates_deferred = not (target_state.text or force)
+        if self._candidates_deferred or not self.target.has_focus:
+            candidates = None
+        else:
             candidates = self.get_candidates(target_state)
 
+        # A keystroke changes both the text and the selection, and cached candidate sources then hand back
+        # the very same sequence; rebuilding the OptionList for it would only churn widgets
+        if candidates is not None and candidates is self._shown_candidates:
+            return
+        self._shown_candidates = candidates
+
+        # Clearing, refilling and highlighting each refresh the list; batch them into a single repaint
+        with self.app.batch_update():
+            option_list.clear_options()
             if candidates:
                 option_list.add_options(candidates)
                 option_list.highlighted = 0
@@ -377,11 +445,26 @@ class Autocomplete(Widget, Generic[TargetWidget]):
         """
         return target_state.text
 
+    @property
+    def candidates(self) -> tuple[AutocompleteOption, ...] | Callable[[TargetState], Sequence[Any]] | None:
+        """The candidates to match on, or a function which returns the candidates to match on.
+
+        A static sequence is stored as a tuple; assign a new sequence to change it.
+        """
+        return self._candidates
+
+    @candidates.setter
+    def candidates(
+        self, candidates: Sequence[AutocompleteOption] | Callable[[TargetState], Sequence[Any]] | None
+    ) -> None:
+        # Frozen once here rather than copied on every keystroke, and immutable so it can't drift from the dropdown
+        self._candidates = tuple(candidates) if isinstance(candidates, Sequence) else candidates
+
     def get_candidates(self, target_state: TargetState) -> Sequence[AutocompleteOption]:
         """Get the candidates to match against."""
         candidates = self.candidates
-        if isinstance(candidates, Sequence):
-            return list(candidates)
+        if isinstance(candidates, tuple):
+            return candidates
         elif candidates is None:
             raise NotImplementedError(
                 "You must implement get_candidates in your Autocomplete subclass, because candidates is None"
@@ -397,4 +480,4 @@ class Autocomplete(Widget, Generic[TargetWidget]):
     @on(OptionList.OptionSelected, "AutoCompleteList")
     def _apply_completion(self, event: OptionList.OptionSelected) -> None:
         # Handles click events on dropdown items.
-        self._complete(event.option_index)
+        self._complete(cast(AutocompleteOption, event.option))
@@ -4,22 +4,48 @@ from __future__ import annotations
 
 import os
 from collections.abc import Sequence
-from os import DirEntry
 from pathlib import Path
 from typing import Any, Callable
 
 from textual.cache import LRUCache
 from textual.content import Content
+from textual.visual import VisualType
 from textual.widgets import Input
 
 from .autocomplete import Autocomplete, AutocompleteOption, TargetState
 
+# A scanned directory entry: (name, lowercased name, is directory, full path)
+_DirectoryEntry = tuple[str, str, bool, str]
+
 
 class PathOption(AutocompleteOption):
-    def __init__(self, prompt: str | Content, value: str, path: Path) -> None:
+    def __init__(
+        self,
+        prompt: str | Content | tuple[Content, str],
+        value: str,
+        path: Path,
+        is_dir: bool | None = None,
+    ) -> None:
         self.value = value
         self.path = path
-        super().__init__(prompt, value)
+        # Directory completions end in "/"; callers that already know the entry type skip re-deriving it
+        self.is_dir = value.endswith("/") if is_dir is None else is_dir
+        # An (icon, name) pair is only assembled into Content once the option is actually displayed
+        self._prompt_parts = prompt if isinstance(prompt, tuple) else None
+        super().__init__(Content() if isinstance(prompt, tuple) else prompt, value)
+
+    @property
+    def prompt(self) -> VisualType:
+        """The prompt, assembled on first access."""
+        if self._prompt_parts is not None:
+            self._prompt = Content.assemble(*self._prompt_parts)
+            self._prompt_parts = None
+        return self._prompt
+
+    def _set_prompt(self, prompt: VisualType) -> None:
+        """Replace the prompt, discarding any parts not yet assembled so they can't overwrite it."""
+        self._prompt_parts = None
+        super()._set_prompt(prompt)
 
 
 def default_path_input_sort_key(item: PathOption) -> tuple[bool, bool, str]:
@@ -33,7 +59,7 @@ def default_path_input_sort_key(item: PathOption) -> tuple[bool, bool, str]:
     """
     name = item.path.name
     is_dotfile = name.startswith(".")
-    return (not item.path.is_dir(), not is_dotfile, name.lower())
+    return (not item.is_dir, not is_dotfile, name.lower())
 
 
 class PathAutocomplete(Autocomplete[Input]):
@@ -65,7 +91,7 @@ class PathAutocomplete(Autocomplete[Input]):
         self.sort_key = sort_key
         self.folder_prefix = folder_prefix
         self.file_prefix = file_prefix
-        self._directory_cache: LRUCache[str, list[DirEntry[str]]] = LRUCache(cache_size)
+        self._directory_cache: LRUCache[tuple[str, int], list[_DirectoryEntry]] = LRUCache(cache_size)
 
     def get_candidates(self, target_state: TargetState) -> Sequence[PathOption]:
         """Get the candidates for the current path segment.
@@ -92,38 +118,36 @@ class PathAutocomplete(Autocomplete[Input]):
             directory = self.path
             search_prefix = current_input
 
-        # Use the directory path as the cache key
-        cache_key = str(directory)
-        cached_entries = self._directory_cache.get(cache_key)
-
-        if cached_entries is not None:
-            entries = cached_entries
-        else:
-            try:
-                entries = list(os.scandir(directory))
+        try:
+            # Keying on the directory's mtime picks up added and removed entries without a manual cache clear
+            cache_key = (str(directory), os.stat(directory).st_mtime_ns)
+            entries = self._directory_cache.get(cache_key)
+            if entries is None:
+                with os.scandir(directory) as it:
+                    entries = [(entry.name, entry.name.lower(), entry.is_dir(), entry.path) for entry in it]
                 self._directory_cache[cache_key] = entries
-            except OSError:
-                return []
+        except OSError:
+            return []
 
+        search_prefix_lower = search_prefix.lower()
+        skip_dotfiles = not self.show_dotfiles
+        folder_prefix, file_prefix = self.folder_prefix, self.file_prefix
         results: list[PathOption] = []
-        for entry in entries:
-            # Only include the entry name, not the full path
-            completion = entry.name
-            if not self.show_dotfiles and completion.startswith("."):
+        # Rejected entries are dropped before any string, Content or Path is built for them
+        for name, name_lower, is_dir, path in entries:
+            if skip_dotfiles and name.startswith("."):
                 continue
             # Filter based on search prefix
-            if search_prefix and not completion.lower().startswith(search_prefix.lower()):
+            if search_prefix_lower and not name_lower.startswith(search_prefix_lower):
                 continue
-            if entry.is_dir():
-                completion += "/"
+            # Only include the entry name, not the full path
+            completion = name + "/" if is_dir else name
             results.append(
                 PathOption(
-                    Content.assemble(
-                        self.folder_prefix if entry.is_dir() else self.file_prefix,
-                        completion,
-                    ),
+                    (folder_prefix if is_dir else file_prefix, completion),
                     completion,
-                    path=Path(entry.path),
+                    path=Path(path),
+                    is_dir=is_dir,
                 )
             )
 
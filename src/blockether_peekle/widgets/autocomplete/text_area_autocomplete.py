@@ -1,3 +1,4 @@
+import re
 from collections.abc import Sequence
 from typing import Any, Callable, Dict
 
@@ -6,6 +7,17 @@ from textual.widgets import TextArea
 
 from .autocomplete import Autocomplete, AutocompleteOption, TargetState
 
+# Identifier characters from the cursor on; \w accepts what isalnum() or "_" do, scanned in C
+_WORD_TAIL = re.compile(r"\w*")
+
+
+def _word_end(line: str, col: int) -> int:
+    """Column just past the identifier characters starting at col."""
+    match = _WORD_TAIL.match(line, col)
+    # \w* matches (possibly empty) at every position
+    assert match is not None
+    return match.end()
+
 
 class TextAreaOption(AutocompleteOption):
     def __init__(
@@ -55,13 +67,11 @@ class TextAreaAutocomplete(Autocomplete[TextArea]):
         start_location = (row, start_col)
 
         # Find the end of the current word (in case cursor is in the middle)
-        text = state.text
-        line = text.split("\n")[row] if "\n" in text else text
-        end_col = col
+        # The document stores lines individually, so only the cursor's line is read
+        line = target.document.get_line(row)
 
         # Move end_col forward to include any remaining characters of the current word
-        while end_col < len(line) and (line[end_col].isalnum() or line[end_col] == "_"):
-            end_col += 1
+        end_col = _word_end(line, col)
 
         end_location = (row, end_col)
 
@@ -72,5 +82,5 @@ class TextAreaAutocomplete(Autocomplete[TextArea]):
         # from being sent to the target widget, meaning AutoComplete won't spot
         # intercept that message, and would not trigger a rebuild like it normally
         # does when a Changed event is received.
-        new_target_state = self._get_target_state()
-        self._rebuild_options(new_target_state)
+        self._target_state = self._get_target_state()
+        self._rebuild_options(self._target_state)
@@ -0,0 +1,473 @@
+"""Interactive Python REPL over the loaded data, with Jedi-backed completion."""
+
+import ast
+import builtins
+import logging
+import threading
+from functools import lru_cache
+from types import CodeType, MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Optional
+
+from rich.console import Group, RenderableType
+from rich.syntax import Syntax
+from rich.text import Text
+from rich.tree import Tree as RichTree
+from textual import events, on, work
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.cache import LRUCache
+from textual.containers import Container, Horizontal
+from textual.message import Message
+from textual.reactive import reactive
+from textual.widgets import RichLog, Static, TextArea
+
+from blockether_peekle.utils import format_value
+
+from .autocomplete import TargetState, TextAreaAutocomplete, TextAreaOption
+
+if TYPE_CHECKING:
+    from jedi import Interpreter
+    from jedi.api.classes import Completion
+
+_QUERY_CACHE_SIZE = 256
+# Completion results kept per (text, cursor, namespace version): enough to cover backspacing and retyping a word
+_COMPLETION_CACHE_SIZE = 32
+# Jedi isn't thread safe: completion on the UI thread and background preloading share its caches
+_JEDI_LOCK = threading.Lock()
+# Failures Jedi is known to raise on modules it can't import or parse
+_JEDI_PRELOAD_ERRORS = (ImportError, SyntaxError, OSError, ValueError, AttributeError, KeyError, AssertionError)
+
+_logger = logging.getLogger(__name__)
+
+_COMPLETION_TYPE_COLORS = MappingProxyType(
+    {
+        "module": "bold green",
+        "class": "bold yellow",
+        "instance": "bold blue",
+        "function": "bold cyan",
+        "param": "bold magenta",
+        "path": "bold green",
+        "keyword": "bold red",
+        "property": "bold blue",
+        "statement": "bold cyan",
+    }
+)
+_DEFAULT_COMPLETION_TYPE_COLOR = "bold magenta"
+# Coloured " type" label suffix per completion type, formatted once instead of per candidate
+_COMPLETION_TYPE_SUFFIXES: Dict[str, str] = {t: f" [{c}]{t}[/{c}]" for t, c in _COMPLETION_TYPE_COLORS.items()}
+# Resolving Completion.type is expensive on large libraries; only the head of the list shows it
+_RESOLVE_TYPES_AT_MOST = 25
+
+
+@lru_cache(maxsize=_QUERY_CACHE_SIZE)
+def _parse_cached(query: str) -> ast.Module:
+    """Parse a query in exec mode, reusing the AST for repeated submissions."""
+    return ast.parse(query, mode="exec")
+
+
+@lru_cache(maxsize=_QUERY_CACHE_SIZE)
+def _compile_statements_cached(query: str) -> CodeType:
+    """Compile a query in exec mode from its cached AST, reusing the code object for repeated submissions."""
+    return compile(_parse_cached(query), "<string>", "exec")
+
+
+@lru_cache(maxsize=_QUERY_CACHE_SIZE)
+def _compile_expression_cached(query: str) -> Optional[CodeType]:
+    """Compile a query in eval mode, reusing the code object (or None for non-expressions) for repeated submissions."""
+    try:
+        return compile(query, "<string>", "eval")
+    except SyntaxError:
+        # Cached too, so repeated statements skip straight to the exec path
+        return None
+
+
+class PeekleReplTextArea(TextArea):
+    @property
+    def gutter_width(self) -> int:
+        return super().gutter_width + 1  # Add extra space for padding
+
+    def on_key(self, event: events.Key) -> None:
+        if event.key == "ctrl+enter":
+            self.insert("\n")
+
+        if event.key == "enter":
+            event.prevent_default()
+
+        if event.character == "(":
+            self.insert("()")
+            self.move_cursor_relative(columns=-1)
+            event.prevent_default()
+
+
+class PeekleReplTextAreaAutocomplete(TextAreaAutocomplete):
+    def apply_completion(self, option: TextAreaOption, state: TargetState) -> None:
+        super().apply_completion(option, state)
+
+        if option.meta:
+            completion_type = option.meta.get("type")
+            # Options past the resolved head carry the Jedi completion; resolve its type only when chosen.
+            # Never wait on a background preload from the UI thread: the name is inserted without "()" then
+            if completion_type is None and "completion" in option.meta and _JEDI_LOCK.acquire(blocking=False):
+                try:
+                    completion_type = option.meta["completion"].type
+                finally:
+                    _JEDI_LOCK.release()
+
+            if completion_type == "function":
+                self.target.insert("()")
+                self.target.move_cursor_relative(columns=-1)
+            elif completion_type == "string":
+                row, col = state.cursor_position
+                start_col = max(0, col - option.completion_prefix_length)
+
+                last_char = self.target.get_text_range((row, start_col - 1), (row, start_col))
+
+                if last_char == "[":
+                    self.target.insert("]")
+
+
+class PeekleRepl(Container):
+    DEFAULT_CSS = """
+    RichLog {
+        overflow-y: auto !important;
+        height: auto;
+        max-height: 0.8fr;
+        background: $surface !important;
+    }
+
+    PeekleReplTextArea {
+        padding: 0 !important;
+        min-height: 0.2fr;
+    }
+
+    #repl-container {
+        layout: horizontal;
+        width: 100%;
+        background: #272823;
+    }
+
+    #repl-indicator {
+        width: 3;
+        padding: 0 1;
+        background: $success;
+        color: $text;
+    }
+    """
+
+    BINDINGS = [
+        Binding(key="ctrl+l", action="clear", description="Clear"),
+    ]
+
+    class QueryExecuted(Message):
+        """Query executed message."""
+
+        def __init__(self, query: str, result: Any) -> None:
+            self.query = query
+            self.result = result
+            super().__init__()
+
+    _locals_data_variable: reactive[str] = reactive("x")
+
+    # Bumped whenever the namespace may have changed, invalidating cached completions
+    _locals_version: int = 0
+    _interpreter_cache: Optional[tuple[tuple[str, int], "Interpreter"]] = None
+    _pending_writes: Optional[list[RenderableType]] = None
+
+    def __init__(self) -> None:
+        self._log = RichLog(markup=True)
+        # A plain per-instance dict: exec() mutates it on every query and nothing watches it
+        self._locals: Dict[str, Any] = {}
+        self._completion_cache: LRUCache[tuple[str, int, int, int], list[TextAreaOption]] = LRUCache(
+            _COMPLETION_CACHE_SIZE
+        )
+        super().__init__()
+
+    def on_mount(self) -> None:
+        self.hook_locals()
+
+        if self._text_area_widget:
+            self._text_area_widget.focus()
+
+        self._warm_completion_engine()
+
+    @work(thread=True, group="warm-up")
+    def _warm_completion_engine(self) -> None:
+        """Import Jedi in the background so the first completion doesn't stall on it."""
+        import jedi
+
+    def preload_completion_module(self, module: str) -> None:
+        """Warm Jedi's cache for a module; safe to call from a worker thread."""
+        from jedi import preload_module
+
+        with _JEDI_LOCK:
+            try:
+                preload_module(module)
+            except _JEDI_PRELOAD_ERRORS:
+                # Best-effort: completion still parses the module on first use
+                _logger.exception("Preloading %r for completion failed", module)
+
+    def action_clear(self) -> None:
+        self._log.clear()
+
+    def execute_query(self, query: str) -> Any:
+        """Execute a Python expression or statement as a query on the data."""
+        # Any query may rebind or mutate names in the namespace
+        self._locals_version += 1
+        try:
+            # Most submissions are plain expressions: compile them straight in eval mode
+            code = _compile_expression_cached(query)
+            if code is not None:
+                return eval(code, self._locals, self._locals)
+
+            # Otherwise parse as exec mode to handle statements
+            parsed = _parse_cached(query)
+
+            # Handle multiple statements
+            if len(parsed.body) > 1:
+                # Execute all statements
+                return self._handle_executed(query, parsed)
+
+            # Single statement handling, dispatched on the exact statement type
+            elif len(parsed.body) == 1:
+                stmt = parsed.body[0]
+                handler = self._STATEMENT_HANDLERS.get(type(stmt), PeekleRepl._handle_executed)
+                return handler(self, query, stmt)
+
+            # Empty input
+            else:
+                return None
+
+        except Exception as e:
+            self._write(f"=> [red]Error:[/red] {e}")
+            return None
+
+    def _handle_import(self, query: str, stmt: ast.AST) -> Any:
+        """Run an import statement and echo it."""
+        exec(_compile_statements_cached(query), self._locals, self._locals)
+        self._write(f"=> [green]✓[/green] {query}")
+        return None
+
+    def _handle_assign(self, query: str, stmt: ast.AST) -> Any:
+        """Run an assignment and echo the assigned value."""
+        assert isinstance(stmt, ast.Assign)
+        exec(_compile_statements_cached(query), self._locals, self._locals)
+        target = stmt.targets[0]
+        if isinstance(target, ast.Name):
+            var_name = target.id
+        else:
+            var_name = str(target)
+        result = self._locals.get(var_name)
+        self._write(f"=> [green]✓[/green] {var_name} = {format_value(result)}")
+        return result
+
+    def _handle_executed(self, query: str, stmt: ast.AST) -> Any:
+        """Run statements (definitions, loops, multiple statements, ...) and report success."""
+        exec(_compile_statements_cached(query), self._locals, self._locals)
+        self._write("=> [green]✓[/green] Executed")
+        return None
+
+    _STATEMENT_HANDLERS: ClassVar[Dict[type, Callable[[Any, str, ast.AST], Any]]] = {
+        ast.Import: _handle_import,
+        ast.ImportFrom: _handle_import,
+        ast.Assign: _handle_assign,
+    }
+
+    def hook_locals(self) -> None:
+        # One dict serves as both globals and locals: REPL-defined functions resolve REPL names as
+        # globals, and builtins are bound up front instead of being injected by the first exec()
+        self._locals = {
+            "__builtins__": builtins,
+            "print": lambda prompt: self._write(
+                Syntax(
+                    f"=> {prompt}",
+                    "python2",
+                    indent_guides=True,
+                    theme="monokai",
+                    background_color="#1E1E1E",
+                ),
+                expand=True,
+            ),
+            "clear": self._log.clear,
+        }
+        # Handed to every Jedi interpreter as the same list object
+        self._namespaces = [self._locals]
+        self._locals_version += 1
+
+    def update_locals_data(self, variable_name: str, data: Any) -> None:
+        """When data changes, update locals and completions."""
+        if data is None:
+            return
+
+        self._locals.pop(self._locals_data_variable, None)
+        self._locals.update({variable_name: data})
+
+        self._locals_data_variable = variable_name
+        self._locals_version += 1
+        # Drop Jedi state that still references the previous data
+        self._completion_cache.clear()
+        self._interpreter_cache = None
+
+    @on(PeekleReplTextAreaAutocomplete.Submitted)
+    def handle_text_area_submitted(self, message: PeekleReplTextAreaAutocomplete.Submitted) -> None:
+        """Handle submitted code from the text area."""
+        # The echo, the outcome and the result tree are collected and land in the log as one write
+        self._pending_writes = [
+            Syntax(
+                f">>> {message.text}",
+                "python2",
+                # line_numbers=True,
+                # indent_guides=True,
+                theme="monokai",
+            )
+        ]
+        try:
+            result = self.execute_query(message.text)
+
+            if result is None or isinstance(result, RichLog):
+                return
+
+            self.post_message(self.QueryExecuted(message.text, result))
+
+            tree = RichTree(
+                f"[bold]{type(result).__name__}[/bold]",
+            )
+            tree.add(format_value(result))
+            self._pending_writes.append(tree)
+        finally:
+            pending, self._pending_writes = self._pending_writes, None
+            self._log.write(Group(*pending), expand=True)
+
+    def _write(self, content: RenderableType, expand: bool = False) -> None:
+        """Write to the log, or queue the write while a submission is being collected."""
+        if isinstance(content, str):
+            content = Text.from_markup(content)
+        if self._pending_writes is not None:
+            self._pending_writes.append(content)
+        else:
+            self._log.write(content, expand=expand)
+
+    @staticmethod
+    def _unresolved_completion_option(completion: "Completion") -> TextAreaOption:
+        """Build a dropdown option without touching the completion's type."""
+        return TextAreaOption(
+            completion.name,
+            completion.name,
+            completion.get_completion_prefix_length(),
+            meta={
+                "completion": completion,
+            },
+        )
+
+    @staticmethod
+    def _completion_option(completion: "Completion") -> TextAreaOption:
+        """Build a dropdown option from a Jedi completion, resolving its type only once."""
+        completion_type = completion.type
+        suffix = _COMPLETION_TYPE_SUFFIXES.get(completion_type)
+        if suffix is None:
+            suffix = _COMPLETION_TYPE_SUFFIXES[completion_type] = (
+                f" [{_DEFAULT_COMPLETION_TYPE_COLOR}]{completion_type}[/{_DEFAULT_COMPLETION_TYPE_COLOR}]"
+            )
+
+        return TextAreaOption(
+            completion.name + suffix,
+            completion.name,
+            completion.get_completion_prefix_length(),
+            meta={
+                "type": completion_type,
+            },
+        )
+
+    # https://github.com/prompt-toolkit/ptpython/blob/main/src/ptpython/completer.py#L216
+    def candidates_callback(self, state: TargetState) -> list[TextAreaOption]:
+        row, col = state.cursor_position
+        # Focus changes, cursor round-trips and retyping after a backspace re-ask for the same completions;
+        # Jedi is the dominant cost
+        key = (state.text, row, col, self._locals_version)
+        cached = self._completion_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if not _JEDI_LOCK.acquire(blocking=False):
+            # A module is being preloaded in the background; don't block the UI or cache the miss
+            return []
+        try:
+            options = self._complete(state.text, row, col)
+        finally:
+            _JEDI_LOCK.release()
+        self._completion_cache[key] = options
+        return options
+
+    def _interpreter_for(self, text: str) -> "Interpreter":
+        """Jedi interpreter for a buffer, reused while only the cursor moves."""
+        key = (text, self._locals_version)
+        cached = self._interpreter_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # Jedi is only needed once the user starts typing, so keep it off the start-up path
+        from jedi import Interpreter
+
+        script = Interpreter(text, self._namespaces)
+        self._interpreter_cache = (key, script)
+        return script
+
+    def _complete(self, text: str, row: int, col: int) -> list[TextAreaOption]:
+        """Ask Jedi for completions at a cursor position."""
+        script = self._interpreter_for(text)
+        if script:
+            try:
+                completions = script.complete(line=row + 1, column=col, fuzzy=True)
+            except TypeError:
+                # Issue #9: bad syntax causes completions() to fail in jedi.
+                # https://github.com/jonathanslenders/python-prompt-toolkit/issues/9
+                pass
+            except UnicodeDecodeError:
+                # Issue #43: UnicodeDecodeError on OpenBSD
+                # https://github.com/jonathanslenders/python-prompt-toolkit/issues/43
+                pass
+            except AttributeError:
+                # Jedi issue #513: https://github.com/davidhalter/jedi/issues/513
+                pass
+            except ValueError:
+                # Jedi issue: "ValueError: invalid \x escape"
+                pass
+            except KeyError:
+                # Jedi issue: "KeyError: u'a_lambda'."
+                # https://github.com/jonathanslenders/ptpython/issues/89
+                pass
+            except OSError:
+                # Jedi issue: "IOError: No such file or directory."
+                # https://github.com/jonathanslenders/ptpython/issues/71
+                pass
+            except AssertionError:
+                # In jedi.parser.__init__.py: 227, in remove_last_newline,
+                # the assertion "newline.value.endswith('\n')" can fail.
+                pass
+            except SystemError:
+                # In jedi.api.helpers.py: 144, in get_stack_at_position
+                # raise SystemError("This really shouldn't happen. There's a bug in Jedi.")
+                pass
+            except NotImplementedError:
+                # See: https://github.com/jonathanslenders/ptpython/issues/223
+                pass
+            except Exception:
+                # Suppress all other Jedi exceptions.
+                pass
+            else:
+                head = [self._completion_option(c) for c in completions[:_RESOLVE_TYPES_AT_MOST]]
+                return head + [self._unresolved_completion_option(c) for c in completions[_RESOLVE_TYPES_AT_MOST:]]
+
+        return []
+
+    def compose(self) -> ComposeResult:
+        yield self._log
+
+        self._text_area_widget = PeekleReplTextArea.code_editor(
+            language="python", tab_behavior="focus", compact=True, theme="monokai", id="repl-input"
+        )
+        yield Horizontal(
+            Static(">", id="repl-indicator"),
+            self._text_area_widget,
+            id="repl-container",
+        )
+        yield PeekleReplTextAreaAutocomplete(self._text_area_widget, candidates=self.candidates_callback)
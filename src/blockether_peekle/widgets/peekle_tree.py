@@ -0,0 +1,286 @@
+"""Lazily expanded tree view of the loaded data."""
+
+import sys
+from itertools import islice
+from typing import Any, Callable, ClassVar, Dict, Iterable, Iterator, Optional
+
+from textual import on
+from textual.app import ComposeResult
+from textual.containers import Container
+from textual.widgets import Tree
+from textual.widgets.tree import TreeNode
+
+from blockether_peekle.utils import format_value
+
+_VALUE_TYPE_STYLE = "bold magenta"
+_ATTR_TYPE_STYLE = "bold cyan"
+_COMMON_TYPES = (dict, list, tuple, set, str, int, float, bool, bytes, type(None))
+
+# Type label markup per style, pre-built for the types that dominate typical pickles
+_TYPE_LABELS: Dict[str, Dict[type, str]] = {
+    style: {t: f"[{style}]{t.__name__}[/{style}]" for t in _COMMON_TYPES}
+    for style in (_VALUE_TYPE_STYLE, _ATTR_TYPE_STYLE)
+}
+
+_CONTAINER_TYPES = (dict, list, tuple, set)
+
+
+def _type_label(value_type: type, style: str) -> str:
+    """Rich markup for a type name, built once per (type, style) pair."""
+    labels = _TYPE_LABELS.setdefault(style, {})
+    label = labels.get(value_type)
+    if label is None:
+        label = labels[value_type] = f"[{style}]{value_type.__name__}[/{style}]"
+    return label
+
+
+class PeekleTree(Container):
+    # Constants for lazy loading
+    _MAX_INITIAL_ITEMS = 100  # Show first N items initially
+
+    # Label templates, bound once so the per-item loops skip re-assembling markup
+    _DICT_KEY_FORMAT: ClassVar[Callable[..., str]] = "[bold cyan]{!r}[/bold cyan]".format
+    _ATTR_KEY_FORMAT: ClassVar[Callable[..., str]] = "[bold magenta]{}[/bold magenta]".format
+    _INDEX_KEY_FORMAT: ClassVar[Callable[..., str]] = "[{}]".format
+    _NODE_LABEL_FORMAT: ClassVar[Callable[..., str]] = "{}: {} {}".format
+    _LEAF_LABEL_FORMAT: ClassVar[Callable[..., str]] = "{}: {}".format
+    _ITEMS_SUMMARY_FORMAT: ClassVar[Callable[..., str]] = "[dim]({} items)[/dim]".format
+    _ATTRS_SUMMARY_FORMAT: ClassVar[Callable[..., str]] = "[dim]({} attributes)[/dim]".format
+    _MORE_LABEL_FORMAT: ClassVar[Callable[..., str]] = (
+        "[bold yellow]... load {} more {} (of {} total)[/bold yellow]".format
+    )
+
+    def __init__(self) -> None:
+        self._tree: Tree[Dict[str, Any]] = Tree("No data")
+        self._summary_cache: Dict[int, tuple[Any, str]] = {}  # Cache (object, summary) by object id
+        self._expandable_cache: Dict[type, bool] = {}  # Cache expandability by type
+        super().__init__()
+
+    def update_tree_data(self, label: str, data: Any) -> None:
+        """When data changes, update tree."""
+        self._summary_cache.clear()
+        self._expandable_cache.clear()
+        self._tree.reset(label)
+        self._tree.root.expand()
+
+        if data is not None:
+            # Build only the first level, repainting once for the whole batch
+            with self.app.batch_update():
+                self._build_tree_level(data, self._tree.root)
+
+    def _is_expandable(self, obj: Any) -> bool:
+        """Check if an object should be expandable in the tree."""
+        # Expandability follows from the type, and a page typically holds only a handful of types
+        obj_type = type(obj)
+        expandable = self._expandable_cache.get(obj_type)
+        if expandable is None:
+            expandable = self._expandable_cache[obj_type] = isinstance(obj, _CONTAINER_TYPES) or (
+                hasattr(obj, "__dict__") and not isinstance(obj, type)
+            )
+        return expandable
+
+    def _get_object_summary(self, obj: Any) -> str:
+        """Get a summary representation of an object, reusing it on repeated expansions."""
+        cached = self._summary_cache.get(id(obj))
+        # The cached object is kept alive and compared by identity so a recycled id never hits
+        if cached is not None and cached[0] is obj:
+            return cached[1]
+
+        summary = self._compute_object_summary(obj)
+        self._summary_cache[id(obj)] = (obj, summary)
+        return summary
+
+    def _compute_object_summary(self, obj: Any) -> str:
+        """Get a summary representation of an object."""
+        # Containers share one summary shape
+        if isinstance(obj, _CONTAINER_TYPES):
+            return self._ITEMS_SUMMARY_FORMAT(len(obj))
+        elif hasattr(obj, "__dict__"):
+            return self._ATTRS_SUMMARY_FORMAT(sum(1 for k in vars(obj) if not k.startswith("_")))
+        else:
+            return format_value(obj, summarize_arrays=True)
+
+    def _build_tree_level(self, obj: Any, parent_node: TreeNode, start_index: int = 0) -> None:
+        """Build only one level of the tree (for lazy loading)."""
+        # Exact built-in containers resolve with a single lookup; subclasses fall back to isinstance
+        builder = self._LEVEL_BUILDERS.get(type(obj))
+        if builder is not None:
+            builder(self, obj, parent_node, start_index)
+        elif isinstance(obj, dict):
+            self._build_dict_level(obj, parent_node, start_index)
+        elif isinstance(obj, (list, tuple, set)):
+            self._build_sequence_level(obj, parent_node, start_index)
+        elif hasattr(obj, "__dict__"):
+            self._build_attrs_level(obj, parent_node, start_index)
+        else:
+            parent_node.add_leaf(format_value(obj, summarize_arrays=True))
+
+    def _build_dict_level(
+        self,
+        obj: Dict[Any, Any],
+        parent_node: TreeNode,
+        start_index: int,
+        items: Optional[Iterator[tuple[Any, Any]]] = None,
+    ) -> None:
+        """Build one level of the tree for a dict, resuming from the previous page's iterator when given."""
+        if items is None:
+            items = islice(obj.items(), start_index, None)
+        try:
+            page = list(islice(items, self._MAX_INITIAL_ITEMS))
+        except RuntimeError:
+            # The dict was resized since the previous page; seek again from the start
+            items = islice(obj.items(), start_index, None)
+            page = list(islice(items, self._MAX_INITIAL_ITEMS))
+
+        self._add_items(((self._DICT_KEY_FORMAT(key), value) for key, value in page), parent_node, _VALUE_TYPE_STYLE)
+        self._add_more_node(parent_node, obj, len(obj), start_index, "items", "dict", items)
+
+    def _build_sequence_level(self, obj: list | tuple | set, parent_node: TreeNode, start_index: int) -> None:
+        """Build one level of the tree for a list, tuple or set."""
+        # Lists and tuples slice natively; sets are not indexable, so walk them lazily
+        items: Iterable[Any] = (
+            obj[start_index : start_index + self._MAX_INITIAL_ITEMS]
+            if isinstance(obj, (list, tuple))
+            else islice(obj, start_index, start_index + self._MAX_INITIAL_ITEMS)
+        )
+        self._add_items(
+            ((self._INDEX_KEY_FORMAT(i), item) for i, item in enumerate(items, start=start_index)),
+            parent_node,
+            _VALUE_TYPE_STYLE,
+        )
+        total = len(obj)
+        if total > start_index + self._MAX_INITIAL_ITEMS and not isinstance(obj, (list, tuple)):
+            # Freeze a set's iteration order once so later pages slice instead of re-walking it
+            obj = tuple(obj)
+        self._add_more_node(parent_node, obj, total, start_index, "items", "list")
+
+    def _build_attrs_level(self, obj: Any, parent_node: TreeNode, start_index: int) -> None:
+        """Build one level of the tree for an object with attributes."""
+        # Filter the public attributes once; the same list backs every "load more" page
+        attrs: list[tuple[str, Any]]
+        # Pydantic is optional: a model can only exist once pydantic has been imported, e.g. by unpickling one
+        pydantic = sys.modules.get("pydantic")
+        try:
+            if pydantic is not None and isinstance(obj, pydantic.BaseModel):
+                # Read the top-level fields directly instead of deep-copying via model_dump()
+                model_type = type(obj)
+                attrs = [
+                    (name, getattr(obj, name)) for name in (*model_type.model_fields, *model_type.model_computed_fields)
+                ]
+                attrs.extend((obj.model_extra or {}).items())
+            elif hasattr(obj, "model_dump"):
+                attrs = list(obj.model_dump().items())
+            else:
+                attrs = [item for item in vars(obj).items() if not item[0].startswith("_")]
+        except Exception:
+            attrs = [item for item in vars(obj).items() if not item[0].startswith("_")]
+
+        self._build_attr_items(attrs, parent_node, start_index)
+
+    def _build_attr_items(self, attrs: list[tuple[str, Any]], parent_node: TreeNode, start_index: int) -> None:
+        """Build one page of already-filtered attribute items."""
+        page = attrs[start_index : start_index + self._MAX_INITIAL_ITEMS]
+        self._add_items(((self._ATTR_KEY_FORMAT(key), value) for key, value in page), parent_node, _ATTR_TYPE_STYLE)
+        self._add_more_node(parent_node, attrs, len(attrs), start_index, "attributes", "attrs")
+
+    def _add_items(self, items: Iterable[tuple[str, Any]], parent_node: TreeNode, type_style: str) -> None:
+        """Add one page of (key markup, value) pairs: expandable values as lazy nodes, the rest as leaves."""
+        # Bind the per-item callables once; the loop runs for every item of every page
+        is_expandable = self._is_expandable
+        get_summary = self._get_object_summary
+        node_label = self._NODE_LABEL_FORMAT
+        leaf_label = self._LEAF_LABEL_FORMAT
+        add_node = parent_node.add
+        add_leaf = parent_node.add_leaf
+        type_labels = _TYPE_LABELS.get(type_style, {})
+
+        for key_str, value in items:
+            if is_expandable(value):
+                value_type = type(value)
+                type_str = type_labels.get(value_type) or _type_label(value_type, type_style)
+                # Create expandable node without children
+                add_node(
+                    node_label(key_str, type_str, get_summary(value)),
+                    data={"value": value, "loaded": False},
+                    expand=False,
+                    allow_expand=True,
+                )
+            else:
+                add_leaf(leaf_label(key_str, format_value(value, summarize_arrays=True)))
+
+    def _add_more_node(
+        self,
+        parent_node: TreeNode,
+        parent_obj: Any,
+        total: int,
+        start_index: int,
+        noun: str,
+        obj_type: str,
+        items: Optional[Iterator[Any]] = None,
+    ) -> None:
+        """Add the "load more" node when items remain past the current page."""
+        remaining = total - start_index - self._MAX_INITIAL_ITEMS
+        if remaining > 0:
+            parent_node.add(
+                self._MORE_LABEL_FORMAT(min(remaining, self._MAX_INITIAL_ITEMS), noun, remaining),
+                data={
+                    "more_items": True,
+                    "parent_obj": parent_obj,
+                    "next_index": start_index + self._MAX_INITIAL_ITEMS,
+                    "obj_type": obj_type,
+                    "items": items,
+                },
+                expand=False,
+                allow_expand=True,
+            )
+
+    _LEVEL_BUILDERS: ClassVar[Dict[type, Callable[[Any, Any, TreeNode, int], None]]] = {
+        dict: _build_dict_level,
+        list: _build_sequence_level,
+        tuple: _build_sequence_level,
+        set: _build_sequence_level,
+    }
+
+    @on(Tree.NodeExpanded)
+    def handle_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """Load children when a node is expanded."""
+        node = event.node
+
+        # Check if node has data
+        if node.data and isinstance(node.data, dict):
+            # Handle "more items" nodes
+            if node.data.get("more_items"):
+                parent_obj = node.data["parent_obj"]
+                next_index = node.data["next_index"]
+
+                # Remove this node and add the next batch of items to parent
+                parent = node.parent
+                if parent:
+                    with self.app.batch_update():
+                        # Remove the "more items" node
+                        node.remove()
+                        # Add the next batch of items
+                        if node.data["obj_type"] == "attrs":
+                            self._build_attr_items(parent_obj, parent, start_index=next_index)
+                        elif node.data["obj_type"] == "dict":
+                            # Continue the previous page's iterator instead of skipping next_index items again
+                            self._build_dict_level(parent_obj, parent, next_index, node.data["items"])
+                        else:
+                            self._build_tree_level(parent_obj, parent, start_index=next_index)
+
+            # Children already built: re-expanding after a collapse keeps them as they are
+            elif node.data.get("loaded", True):
+                return
+
+            # Handle regular expandable nodes
+            else:
+                value = node.data.get("value")
+                if value is not None:
+                    # Lazily added nodes start without children, so build straight into them
+                    with self.app.batch_update():
+                        self._build_tree_level(value, node)
+                    # Mark as loaded
+                    node.data["loaded"] = True
+
+    def compose(self) -> ComposeResult:
+        yield self._tree
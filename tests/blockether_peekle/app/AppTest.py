@@ -0,0 +1,61 @@
+from collections import OrderedDict
+from fractions import Fraction
+from pathlib import Path
+
+import pytest
+
+from blockether_peekle.app import _PRELOAD_SCAN_LIMIT, PeekleApp, _data_modules
+
+
+class MainModuleValue:
+    """Stands in for a class defined in a pickling script."""
+
+
+MainModuleValue.__module__ = "__main__"
+
+
+class TestDataModules:
+    def test_collects_top_level_modules_of_nested_values(self) -> None:
+        data = {"ordered": OrderedDict(), "values": [Fraction(1, 2)]}
+
+        assert _data_modules(data) == {"collections", "fractions"}
+
+    def test_skips_builtins_and_main(self) -> None:
+        data = [1, "two", MainModuleValue()]
+
+        assert _data_modules(data) == set()
+
+    def test_scans_values_within_the_limit(self) -> None:
+        # The root itself takes one of the scanned slots
+        data = [0] * (_PRELOAD_SCAN_LIMIT - 2) + [Fraction(1, 2)]
+
+        assert _data_modules(data) == {"fractions"}
+
+    def test_stops_at_the_scan_limit(self) -> None:
+        data = [0] * (_PRELOAD_SCAN_LIMIT - 1) + [Fraction(1, 2)]
+
+        assert _data_modules(data) == set()
+
+    def test_stops_at_the_scan_limit_across_nesting(self) -> None:
+        data = [[0] * _PRELOAD_SCAN_LIMIT, [Fraction(1, 2)]]
+
+        assert _data_modules(data) == set()
+
+
+@pytest.mark.anyio
+class TestLoadFile:
+    CORRUPT_PICKLE = b"not a pickle"
+
+    async def test_corrupt_file_is_reported_and_clears_the_loading_state(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "corrupt.pkl"
+        filepath.write_bytes(self.CORRUPT_PICKLE)
+        app = PeekleApp(filepath)
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert not app._tree.loading
+            assert app._filepath is None
+            assert [notification.message for notification in app._notifications] == [
+                f"[red]✗[/red] Error loading {filepath} file: invalid load key, 'n'."
+            ]
@@ -0,0 +1,22 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from blockether_peekle.main import main
+
+
+class TestMain:
+    def test_missing_file_exits_before_loading_the_ui(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        missing = tmp_path / "missing.pkl"
+        monkeypatch.setattr(sys, "argv", ["blockether_peekle", str(missing)])
+        # Any import of the UI module now fails loudly
+        monkeypatch.setitem(sys.modules, "blockether_peekle.app", None)
+
+        with pytest.raises(SystemExit) as exit_info:
+            main()
+
+        assert exit_info.value.code == 1
+        assert capsys.readouterr().out == f"Error: File '{missing}' not found\n"
@@ -0,0 +1,72 @@
+from unittest.mock import Mock
+
+from blockether_peekle.utils import format_value
+
+
+class TestFormatValue:
+    MAX_LENGTH = 5
+    MATRIX_SHAPE = (2, 3)
+
+    def test_formats_scalars(self) -> None:
+        assert format_value(None) == "[bold magenta]None[/bold magenta]"
+        assert format_value(True) == "[bold cyan]True[/bold cyan]"
+        assert format_value(42) == "[bold blue]42[/bold blue]"
+        assert format_value(1.5) == "[bold blue]1.5[/bold blue]"
+
+    def test_formats_scalar_subclasses_like_their_base(self) -> None:
+        class Flag(int):
+            pass
+
+        assert format_value(Flag(3)) == "[bold blue]3[/bold blue]"
+
+    def test_truncates_long_strings(self) -> None:
+        assert format_value("abcdefgh", max_length=self.MAX_LENGTH) == "[bold green]'abcde...'[/bold green]"
+
+    def test_str_subclasses_keep_their_own_repr(self) -> None:
+        class Name(str):
+            def __repr__(self) -> str:
+                return f"Name({str(self)!r})"
+
+        assert format_value("ab") == "[bold green]'ab'[/bold green]"
+        assert format_value(Name("ab")) == "[bold green]Name('ab')[/bold green]"
+
+    def test_summarises_dict_keys(self) -> None:
+        assert format_value({"a": 1, "b": "x"}) == "[bold yellow]{a: int, b: str}[/bold yellow]"
+
+    def test_summarises_array_likes_by_shape_and_dtype(self) -> None:
+        assert (
+            format_value(self._Array(self.MATRIX_SHAPE), summarize_arrays=True)
+            == "[bold yellow]<_Array shape=(2, 3) dtype=float64>[/bold yellow]"
+        )
+
+    def test_shows_array_likes_by_value_unless_asked_to_summarise(self) -> None:
+        assert format_value(self._Array(self.MATRIX_SHAPE)) == "[bold yellow]array[/bold yellow]"
+
+    def test_shows_zero_dimensional_scalars_by_value(self) -> None:
+        assert format_value(self._Array(()), summarize_arrays=True) == "[bold yellow]array[/bold yellow]"
+
+    def test_falls_back_to_str_when_shape_is_not_a_tuple(self) -> None:
+        mock = Mock()
+        assert format_value(mock, summarize_arrays=True) == f"[bold yellow]{str(mock)}[/bold yellow]"
+
+    def test_falls_back_to_str_when_shape_raises(self) -> None:
+        class Broken:
+            dtype = "float64"
+
+            @property
+            def shape(self) -> tuple[int, ...]:
+                raise ValueError("no shape")
+
+            def __str__(self) -> str:
+                return "broken"
+
+        assert format_value(Broken(), summarize_arrays=True) == "[bold yellow]broken[/bold yellow]"
+
+    class _Array:
+        dtype = "float64"
+
+        def __init__(self, shape: tuple[int, ...]) -> None:
+            self.shape = shape
+
+        def __str__(self) -> str:
+            return "array"
@@ -0,0 +1,34 @@
+import gzip
+import os
+import pickle
+from pathlib import Path
+
+import pytest
+
+from blockether_peekle.utils import load_pickle
+
+
+class TestLoadPickle:
+    DATA = {"name": "peekle", "values": [1, 2, 3], "nested": {"flag": True}}
+
+    def test_loads_plain_pickle(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "data.pkl"
+        filepath.write_bytes(pickle.dumps(self.DATA))
+
+        assert load_pickle(filepath) == self.DATA
+
+    def test_loads_gzip_compressed_pickle(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "data.pkl.gz"
+        filepath.write_bytes(gzip.compress(pickle.dumps(self.DATA)))
+
+        assert load_pickle(filepath) == self.DATA
+
+    def test_loads_when_read_ahead_hint_is_rejected(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        def reject_hint(fd: int, offset: int, length: int, advice: int) -> None:
+            raise OSError("advice not supported")
+
+        monkeypatch.setattr(os, "posix_fadvise", reject_hint, raising=False)
+        filepath = tmp_path / "data.pkl"
+        filepath.write_bytes(pickle.dumps(self.DATA))
+
+        assert load_pickle(filepath) == self.DATA
@@ -0,0 +1,98 @@
+from collections.abc import Sequence
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.content import Content
+from textual.widgets import TextArea
+
+from blockether_peekle.widgets.autocomplete import AutocompleteOption, TargetState, TextAreaAutocomplete, TextAreaOption
+
+
+class SlowAutocomplete(TextAreaAutocomplete):
+    # Long enough that a pilot's keystrokes always land inside one debounce window
+    TARGET_UPDATE_DELAY = 0.5
+
+
+class AutocompleteApp(App):
+    COMPLETION_SUFFIX = "_done"
+
+    def __init__(self) -> None:
+        self.text_area = TextArea()
+        self.autocomplete = SlowAutocomplete(self.text_area, candidates=self.candidates)
+        self.candidate_requests: list[str] = []
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        yield self.text_area
+        yield self.autocomplete
+
+    def on_mount(self) -> None:
+        self.text_area.focus()
+
+    def candidates(self, state: TargetState) -> Sequence[TextAreaOption]:
+        """One option completing whatever was typed, recording each request."""
+        self.candidate_requests.append(state.text)
+        completed = state.text + self.COMPLETION_SUFFIX
+        return [TextAreaOption(completed, completed, len(state.text))]
+
+
+class TestAutocompleteOption:
+    def test_prompt_text_is_the_plain_text_of_a_styled_prompt(self) -> None:
+        assert AutocompleteOption(Content.from_markup("[b]keys[/b]")).prompt_text == "keys"
+
+    def test_prompt_text_follows_a_replaced_prompt(self) -> None:
+        option = AutocompleteOption("keys")
+        assert option.prompt_text == "keys"
+
+        option._set_prompt("values")
+
+        assert option.prompt_text == "values"
+
+
+class TestStaticCandidates:
+    OPTIONS = ("keys", "values")
+
+    def test_assigned_sequence_is_frozen(self) -> None:
+        options = [TextAreaOption(name, name, 0) for name in self.OPTIONS]
+        autocomplete = TextAreaAutocomplete(TextArea())
+
+        autocomplete.candidates = options
+        options.clear()
+
+        assert [option.prompt for option in autocomplete.get_candidates(TargetState("", (0, 0)))] == list(self.OPTIONS)
+
+    def test_in_place_mutation_is_rejected(self) -> None:
+        autocomplete = TextAreaAutocomplete(TextArea())
+        autocomplete.candidates = [TextAreaOption(name, name, 0) for name in self.OPTIONS]
+
+        with pytest.raises(AttributeError):
+            autocomplete.candidates.append(TextAreaOption("items", "items", 0))  # type: ignore[union-attr]
+
+    def test_every_lookup_returns_the_same_sequence(self) -> None:
+        autocomplete = TextAreaAutocomplete(TextArea())
+        autocomplete.candidates = [TextAreaOption(name, name, 0) for name in self.OPTIONS]
+        state = TargetState("", (0, 0))
+
+        assert autocomplete.get_candidates(state) is autocomplete.get_candidates(state)
+
+
+@pytest.mark.anyio
+class TestDebouncedTargetUpdate:
+    async def test_burst_of_keystrokes_asks_for_candidates_once(self) -> None:
+        app = AutocompleteApp()
+        async with app.run_test() as pilot:
+            await pilot.press("f", "o", "o")
+            assert app.candidate_requests == []
+
+            await pilot.pause(2 * SlowAutocomplete.TARGET_UPDATE_DELAY)
+
+            assert app.candidate_requests == ["foo"]
+            assert app.autocomplete.display
+
+    async def test_tab_inside_the_debounce_window_completes_the_current_text(self) -> None:
+        app = AutocompleteApp()
+        async with app.run_test() as pilot:
+            await pilot.press("f", "o", "o", "tab")
+
+            assert app.text_area.text == "foo" + AutocompleteApp.COMPLETION_SUFFIX
+            assert app.candidate_requests[0] == "foo"
@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from textual.content import Content
+
+from blockether_peekle.widgets.autocomplete import PathOption
+from blockether_peekle.widgets.autocomplete.path_autocomplete import default_path_input_sort_key
+
+
+class TestPathOption:
+    def test_directory_flag_defaults_from_the_trailing_slash(self) -> None:
+        assert PathOption("data/", "data/", Path("data")).is_dir
+        assert not PathOption("data.pkl", "data.pkl", Path("data.pkl")).is_dir
+
+    def test_explicit_directory_flag_wins(self) -> None:
+        assert PathOption("data", "data", Path("data"), is_dir=True).is_dir
+
+    def test_prompt_is_assembled_from_icon_and_name(self) -> None:
+        option = PathOption((Content("+"), "data/"), "data/", Path("data"))
+
+        assert option.prompt == Content("+data/")
+
+    def test_replaced_prompt_is_not_overwritten_by_the_pending_parts(self) -> None:
+        option = PathOption((Content("+"), "data/"), "data/", Path("data"))
+
+        option._set_prompt("renamed/")
+
+        assert option.prompt == "renamed/"
+
+
+class TestDefaultSortKey:
+    def test_directories_sort_before_files_without_an_explicit_flag(self) -> None:
+        options = [
+            PathOption("a.pkl", "a.pkl", Path("a.pkl")),
+            PathOption("b/", "b/", Path("b")),
+        ]
+
+        assert [option.value for option in sorted(options, key=default_path_input_sort_key)] == ["b/", "a.pkl"]
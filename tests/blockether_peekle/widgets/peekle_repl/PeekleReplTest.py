@@ -0,0 +1,113 @@
+from collections.abc import AsyncIterator
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.pilot import Pilot
+
+from blockether_peekle.widgets.autocomplete import TargetState, TextAreaOption
+from blockether_peekle.widgets.peekle_repl import _JEDI_LOCK, PeekleRepl, PeekleReplTextAreaAutocomplete
+
+
+class PeekleReplApp(App):
+    def __init__(self) -> None:
+        self.repl = PeekleRepl()
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        yield self.repl
+
+
+@pytest.fixture
+async def pilot() -> AsyncIterator[Pilot[None]]:
+    async with PeekleReplApp().run_test() as pilot:
+        yield pilot
+
+
+async def _run(pilot: Pilot[None], query: str) -> tuple[object, list[str]]:
+    """Execute a query, returning its result and the log lines it wrote."""
+    repl = pilot.app.query_one(PeekleRepl)
+    repl.action_clear()
+    result = repl.execute_query(query)
+    await pilot.pause()
+    return result, [line.text.rstrip() for line in repl._log.lines]
+
+
+@pytest.mark.anyio
+class TestExecuteQuery:
+    async def test_expression_returns_its_value_without_logging(self, pilot: Pilot[None]) -> None:
+        result, lines = await _run(pilot, "1 + 2")
+
+        assert result == 3
+        assert lines == []
+
+    async def test_assignment_binds_the_name_and_echoes_the_value(self, pilot: Pilot[None]) -> None:
+        result, lines = await _run(pilot, "y = 40 + 2")
+
+        assert result == 42
+        assert lines == ["=> ✓ y = 42"]
+        assert pilot.app.query_one(PeekleRepl)._locals["y"] == 42
+
+    async def test_import_echoes_the_statement(self, pilot: Pilot[None]) -> None:
+        result, lines = await _run(pilot, "import math")
+
+        assert result is None
+        assert lines == ["=> ✓ import math"]
+        assert pilot.app.query_one(PeekleRepl).execute_query("math.floor(2.5)") == 2
+
+    async def test_multiple_statements_run_in_order(self, pilot: Pilot[None]) -> None:
+        result, lines = await _run(pilot, "a = 1; b = a + 1")
+
+        assert result is None
+        assert lines == ["=> ✓ Executed"]
+        assert pilot.app.query_one(PeekleRepl).execute_query("b") == 2
+
+    async def test_syntax_error_is_logged(self, pilot: Pilot[None]) -> None:
+        result, lines = await _run(pilot, "1 +")
+
+        assert result is None
+        assert lines[0].startswith("=> Error: invalid syntax")
+
+    async def test_runtime_error_is_logged(self, pilot: Pilot[None]) -> None:
+        result, lines = await _run(pilot, "1 / 0")
+
+        assert result is None
+        assert lines == ["=> Error: division by zero"]
+
+    async def test_every_query_bumps_the_locals_version(self, pilot: Pilot[None]) -> None:
+        repl = pilot.app.query_one(PeekleRepl)
+        version = repl._locals_version
+
+        repl.execute_query("1")
+        repl.execute_query("1 +")
+
+        assert repl._locals_version == version + 2
+
+
+class FunctionCompletion:
+    """Stands in for an unresolved Jedi completion of a function."""
+
+    type = "function"
+
+
+@pytest.mark.anyio
+class TestApplyCompletion:
+    NAME = "len"
+    EMPTY_STATE = TargetState("", (0, 0))
+
+    def _option(self) -> TextAreaOption:
+        return TextAreaOption(self.NAME, self.NAME, 0, meta={"completion": FunctionCompletion()})
+
+    async def test_function_completion_adds_call_parentheses(self, pilot: Pilot[None]) -> None:
+        autocomplete = pilot.app.query_one(PeekleReplTextAreaAutocomplete)
+
+        autocomplete.apply_completion(self._option(), self.EMPTY_STATE)
+
+        assert autocomplete.target.text == "len()"
+
+    async def test_busy_jedi_inserts_the_bare_name_without_waiting(self, pilot: Pilot[None]) -> None:
+        autocomplete = pilot.app.query_one(PeekleReplTextAreaAutocomplete)
+
+        with _JEDI_LOCK:
+            autocomplete.apply_completion(self._option(), self.EMPTY_STATE)
+
+        assert autocomplete.target.text == "len"
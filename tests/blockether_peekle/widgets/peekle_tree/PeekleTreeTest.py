@@ -0,0 +1,110 @@
+from typing import Any
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.widgets.tree import TreeNode
+
+from blockether_peekle.widgets.peekle_tree import PeekleTree
+
+
+class PeekleTreeApp(App):
+    def __init__(self) -> None:
+        self.peekle_tree = PeekleTree()
+        super().__init__()
+
+    def compose(self) -> ComposeResult:
+        yield self.peekle_tree
+
+
+def _shown_keys(node: TreeNode[Any]) -> list[int]:
+    """Integer keys of the item leaves under a node, in display order."""
+    return [int(str(child.label).partition(":")[0]) for child in node.children if not child.data]
+
+
+def _more_node(node: TreeNode[Any]) -> TreeNode[Any]:
+    """The trailing "load more" node."""
+    more = node.children[-1]
+    assert more.data is not None and more.data["more_items"]
+    return more
+
+
+@pytest.mark.anyio
+class TestDictPagination:
+    PAGE_SIZE = PeekleTree._MAX_INITIAL_ITEMS
+    INITIAL_SIZE = 2 * PAGE_SIZE + 50
+    GROWTH = 30
+
+    async def test_pages_through_every_key_once(self) -> None:
+        data = {i: i for i in range(self.INITIAL_SIZE)}
+        app = PeekleTreeApp()
+        async with app.run_test() as pilot:
+            app.peekle_tree.update_tree_data("x", data)
+            root = app.peekle_tree._tree.root
+
+            _more_node(root).expand()
+            await pilot.pause()
+            _more_node(root).expand()
+            await pilot.pause()
+
+            assert _shown_keys(root) == list(range(self.INITIAL_SIZE))
+            assert not root.children[-1].data
+
+    async def test_growing_the_dict_between_pages_neither_skips_nor_repeats_keys(self) -> None:
+        data = {i: i for i in range(self.INITIAL_SIZE)}
+        app = PeekleTreeApp()
+        async with app.run_test() as pilot:
+            app.peekle_tree.update_tree_data("x", data)
+            root = app.peekle_tree._tree.root
+
+            data.update((i, i) for i in range(self.INITIAL_SIZE, self.INITIAL_SIZE + self.GROWTH))
+            _more_node(root).expand()
+            await pilot.pause()
+            data.update((i, i) for i in range(self.INITIAL_SIZE + self.GROWTH, self.INITIAL_SIZE + 2 * self.GROWTH))
+            _more_node(root).expand()
+            await pilot.pause()
+            # The growth spilled into a third page
+            _more_node(root).expand()
+            await pilot.pause()
+
+            assert _shown_keys(root) == list(range(self.INITIAL_SIZE + 2 * self.GROWTH))
+            assert not root.children[-1].data
+
+
+def _shown_attrs(node: TreeNode[Any]) -> list[str]:
+    """Attribute names listed under a node, in display order."""
+    return [str(child.label).partition(":")[0] for child in node.children]
+
+
+class PlainObject:
+    def __init__(self) -> None:
+        self.visible = 1
+        self._hidden = 2
+
+
+@pytest.mark.anyio
+class TestAttributeLevel:
+    async def test_lists_public_attributes_of_plain_objects(self) -> None:
+        app = PeekleTreeApp()
+        async with app.run_test():
+            app.peekle_tree.update_tree_data("x", PlainObject())
+
+            assert _shown_attrs(app.peekle_tree._tree.root) == ["visible"]
+
+    async def test_lists_pydantic_fields_computed_fields_and_extras(self) -> None:
+        pydantic: Any = pytest.importorskip("pydantic")
+
+        class Model(pydantic.BaseModel):
+            model_config = pydantic.ConfigDict(extra="allow")
+
+            declared: int
+
+            @pydantic.computed_field  # type: ignore[prop-decorator]
+            @property
+            def computed(self) -> int:
+                return self.declared * 2
+
+        app = PeekleTreeApp()
+        async with app.run_test():
+            app.peekle_tree.update_tree_data("x", Model(declared=1, extra=3))
+
+            assert _shown_attrs(app.peekle_tree._tree.root) == ["declared", "computed", "extra"]
@@ -1,2 +1,22 @@
+from blockether_peekle.widgets.autocomplete.text_area_autocomplete import _word_end
+
+
 def test_placeholder() -> None:
     pass
+
+
+class TestWordEnd:
+    def test_stops_at_the_first_non_identifier_character(self) -> None:
+        assert _word_end("x.keys()", 2) == 6
+
+    def test_runs_to_the_end_of_the_line(self) -> None:
+        assert _word_end("x.ke_y9", 2) == 7
+
+    def test_handles_non_ascii_identifiers(self) -> None:
+        assert _word_end("x.café + 1", 2) == 6
+
+    def test_stays_put_when_no_identifier_follows(self) -> None:
+        assert _word_end("x.keys()", 6) == 6
+
+    def test_stays_put_at_the_end_of_the_line(self) -> None:
+        assert _word_end("x.keys", 6) == 6